@@ -5,15 +5,53 @@ Permite gestionar issues, projects, sprints y más desde Claude
 """
 
 import asyncio
-import json
 import sys
 import os
 import base64
+import time
+import operator
 import httpx
-from typing import Dict, List, Optional, Any
+import importlib.util
+from typing import Callable, Dict, List, NamedTuple, Optional, Any, Tuple
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        # read_resource debe devolver str: MCP envía los bytes como blob base64
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+    _loads = orjson.loads
+except ImportError:
+    # orjson es opcional: sin él usamos el json de la librería estándar
+    import json
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+    _loads = json.loads
+
+try:
+    import simdjson
+except ImportError:
+    # pysimdjson es opcional: sin él se parsea todo con _loads
+    simdjson = None
+
+def _parse_lazy(content: bytes) -> Any:
+    """Parsear JSON con simdjson si está disponible"""
+    if simdjson is None:
+        return _loads(content)
+    # Un parser por documento: los proxies que devuelve solo materializan las
+    # claves que se leen, pero un parser compartido queda inutilizable mientras
+    # sobreviva alguno (p. ej. retenido por el traceback de una excepción)
+    return simdjson.Parser().parse(content)
+
+# HTTP/2 requiere el paquete h2 (httpx[http2]); sin él usamos HTTP/1.1
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
 try:
     from mcp.server import Server, NotificationOptions
     from mcp.server.models import InitializationOptions
@@ -23,8 +61,20 @@ except ImportError as e:
     print(f"❌ Error: MCP no está instalado. Ejecuta: uv add mcp", file=sys.stderr)
     sys.exit(1)
 
-@dataclass
-class JiraIssue:
+# Campos de issue que se piden a la API
+ISSUE_FIELDS = "summary,status,assignee,priority,issuetype,created,updated,description"
+
+# Máximo de resultados por página que devuelve /search
+SEARCH_PAGE_SIZE = 100
+
+# Máximo de páginas de /search pedidas a la vez
+SEARCH_CONCURRENCY = 4
+
+# Caché de transiciones por workflow: {(proyecto, tipo): (timestamp, {nombre: id})}
+TRANSITION_CACHE_TTL = 600
+_transition_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, str]]] = {}
+
+class JiraIssue(NamedTuple):
     """Modelo de issue de Jira"""
     key: str
     summary: str
@@ -36,7 +86,7 @@ class JiraIssue:
     updated: str
     description: str = ""
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class JiraProject:
     """Modelo de proyecto de Jira"""
     key: str
@@ -44,6 +94,117 @@ class JiraProject:
     project_type: str
     lead: str
 
+# Caché LRU de issues con TTL: {issue_key: (timestamp, JiraIssue)}
+ISSUE_CACHE_SIZE = 256
+ISSUE_CACHE_TTL = 60
+_issue_cache: "OrderedDict[str, Tuple[float, JiraIssue]]" = OrderedDict()
+
+# Las claves de Jira no distinguen mayúsculas: la caché usa siempre mayúsculas
+def _cache_issue(issue: JiraIssue):
+    """Guardar un issue en la caché, descartando el menos usado si está llena"""
+    key = issue.key.upper()
+    _issue_cache[key] = (time.monotonic(), issue)
+    _issue_cache.move_to_end(key)
+    if len(_issue_cache) > ISSUE_CACHE_SIZE:
+        _issue_cache.popitem(last=False)
+    _remember_issue_type(key, issue.issue_type)
+
+def _cached_issue(issue_key: str) -> Optional[JiraIssue]:
+    """Obtener un issue de la caché si no ha expirado"""
+    key = issue_key.upper()
+    cached = _issue_cache.get(key)
+    if cached and time.monotonic() - cached[0] < ISSUE_CACHE_TTL:
+        _issue_cache.move_to_end(key)
+        return cached[1]
+    return None
+
+def _evict_issue(issue_key: str):
+    """Quitar un issue de la caché tras modificarlo"""
+    _issue_cache.pop(issue_key.upper(), None)
+
+# Tipo de cada issue visto: {issue_key: tipo}. Una transición no cambia el
+# tipo, así que _evict_issue no lo borra y transition_issue puede usarlo
+ISSUE_TYPE_CACHE_SIZE = 1024
+_issue_types: "OrderedDict[str, str]" = OrderedDict()
+
+def _remember_issue_type(issue_key: str, issue_type: str):
+    """Recordar el tipo de un issue, descartando el menos usado si está lleno"""
+    key = issue_key.upper()
+    _issue_types[key] = issue_type
+    _issue_types.move_to_end(key)
+    if len(_issue_types) > ISSUE_TYPE_CACHE_SIZE:
+        _issue_types.popitem(last=False)
+
+# Máximo de respuestas guardadas para GETs condicionales con ETag
+ETAG_CACHE_SIZE = 512
+
+def _require(obj: Any, field: str) -> Any:
+    """Leer un campo obligatorio del JSON de Jira; si falta, el error lo nombra"""
+    try:
+        return obj[field]
+    except KeyError:
+        # simdjson no incluye la clave en su KeyError
+        owner = obj.get("key") or obj.get("id") or "?"
+        raise ValueError(f"Respuesta de Jira sin el campo '{field}' ({owner})") from None
+
+def _desc_text(desc: Any) -> str:
+    """Extraer el texto del primer párrafo de una descripción ADF"""
+    try:
+        return desc["content"][0]["content"][0]["text"]
+    except (KeyError, IndexError, TypeError):
+        return ""
+
+def _name_of(value: Any, attr: str, default: str) -> str:
+    """Leer un atributo de un objeto anidado que puede venir vacío o null"""
+    return value.get(attr, default) if value else default
+
+_get_fields = operator.itemgetter("fields")
+_get_key = operator.itemgetter("key")
+
+def _issue_from_json(issue: Any) -> JiraIssue:
+    """Construir un JiraIssue a partir del JSON de la API"""
+    try:
+        key = _get_key(issue)
+        fields = _get_fields(issue)
+    except KeyError:
+        # Repetir con _require para que el error nombre el campo que falta
+        _require(issue, "key")
+        _require(issue, "fields")
+        raise
+    
+    get = fields.get
+    status = get("status")
+    assignee = get("assignee")
+    priority = get("priority")
+    issue_type = get("issuetype")
+    
+    # Argumentos posicionales en el orden de JiraIssue._fields: con palabras
+    # clave el __new__ de NamedTuple es casi el doble de lento
+    return JiraIssue(
+        key,
+        get("summary", "Sin título"),
+        status.get("name", "Desconocido") if status else "Desconocido",
+        assignee.get("displayName", "Sin asignar") if assignee else "Sin asignar",
+        priority.get("name", "Sin prioridad") if priority else "Sin prioridad",
+        issue_type.get("name", "Desconocido") if issue_type else "Desconocido",
+        get("created", ""),
+        get("updated", ""),
+        _desc_text(get("description"))
+    )
+
+def _project_dict(project: Any) -> Dict[str, Any]:
+    """Proyectar el JSON de un proyecto a los campos que expone el servidor"""
+    return {
+        "key": _require(project, "key"),
+        "name": _require(project, "name"),
+        "type": project.get("projectTypeKey", "unknown"),
+        "lead": _name_of(project.get("lead"), "displayName", "Sin asignar")
+    }
+
+def _jql_escape(value: str) -> str:
+    """Escapar un valor para usarlo dentro de comillas simples en JQL"""
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
 class JiraManager:
     """Gestor de API de Jira"""
     
@@ -57,113 +218,173 @@ class JiraManager:
         auth_bytes = auth_string.encode('ascii')
         auth_b64 = base64.b64encode(auth_bytes).decode('ascii')
         
-        self.headers = {
+        # Headers normalizados una sola vez y compartidos por el cliente
+        self.headers = httpx.Headers({
             "Authorization": f"Basic {auth_b64}",
             "Accept": "application/json",
             "Content-Type": "application/json"
-        }
+        })
+        
+        # Cliente compartido: reutiliza conexiones TCP/TLS entre llamadas
+        self.client = httpx.AsyncClient(
+            base_url=self.jira_url,
+            headers=self.headers,
+            http2=_HTTP2,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+        )
+        
+        # Parámetro de campos constante, construido una sola vez
+        self._fields_params = [("fields", ISSUE_FIELDS)]
+        
+        # Resultados de GETs condicionales: {clave: (etag, resultado)}
+        self._etag_cache: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
+    
+    async def aclose(self):
+        """Cerrar el cliente HTTP compartido"""
+        await self.client.aclose()
     
     async def get_myself(self) -> Dict[str, Any]:
         """Obtener información del usuario actual"""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.jira_url}/rest/api/3/myself",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self.client.get("/rest/api/3/myself")
+        response.raise_for_status()
+        return _loads(response.content)
+    
+    async def _get_conditional(self, cache_key: str, url: str, build: Callable[[Any], Any], params: Any = None) -> Any:
+        """GET con If-None-Match: si Jira responde 304 se reutiliza el resultado anterior"""
+        cached = self._etag_cache.get(cache_key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        
+        response = await self.client.get(url, params=params, headers=headers)
+        if cached and response.status_code == 304:
+            self._etag_cache.move_to_end(cache_key)
+            return cached[1]
+        
+        response.raise_for_status()
+        result = build(_parse_lazy(response.content))
+        
+        etag = response.headers.get("etag")
+        if etag:
+            self._etag_cache[cache_key] = (etag, result)
+            self._etag_cache.move_to_end(cache_key)
+            if len(self._etag_cache) > ETAG_CACHE_SIZE:
+                self._etag_cache.popitem(last=False)
+        
+        return result
     
     async def get_projects(self) -> List[JiraProject]:
         """Obtener todos los proyectos"""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.jira_url}/rest/api/3/project",
-                headers=self.headers
+        return [
+            JiraProject(
+                key=project["key"],
+                name=project["name"],
+                project_type=project["type"],
+                lead=project["lead"]
             )
-            response.raise_for_status()
-            projects_data = response.json()
-            
-            return [
-                JiraProject(
-                    key=project["key"],
-                    name=project["name"],
-                    project_type=project.get("projectTypeKey", "unknown"),
-                    lead=project.get("lead", {}).get("displayName", "Sin asignar")
-                )
-                for project in projects_data
-            ]
+            for project in await self.get_projects_dicts()
+        ]
+    
+    async def get_projects_dicts(self) -> List[Dict[str, Any]]:
+        """Obtener todos los proyectos como dicts listos para serializar"""
+        def build(projects_data: Any) -> List[Dict[str, Any]]:
+            return [_project_dict(project) for project in projects_data]
+        
+        return await self._get_conditional("projects", "/rest/api/3/project", build)
+    
+    def _build_jql(self, jql: str = None, assignee: str = None, project: str = None) -> str:
+        """Construir JQL a partir de filtros si no se proporciona"""
+        if jql:
+            return jql
+        
+        conditions = []
+        if assignee:
+            if assignee.lower() == "me":
+                conditions.append("assignee = currentUser()")
+            else:
+                conditions.append(f"assignee = '{_jql_escape(assignee)}'")
+        if project:
+            conditions.append(f"project = '{_jql_escape(project)}'")
+        
+        return " AND ".join(conditions) if conditions else "order by updated DESC"
+    
+    async def _search_page(self, jql: str, start_at: int, max_results: int, build: Callable[[Any], Any]) -> Tuple[List[Any], int]:
+        """Obtener una página de búsqueda y el total de resultados, aplicando build a cada issue"""
+        params = self._fields_params + [
+            ("jql", jql),
+            ("startAt", start_at),
+            ("maxResults", max_results)
+        ]
+        
+        response = await self.client.get("/rest/api/3/search", params=params)
+        response.raise_for_status()
+        data = _parse_lazy(response.content)
+        
+        return [build(issue) for issue in data.get("issues", [])], data.get("total", 0)
+    
+    async def _search(self, jql: str, max_results: int, build: Callable[[Any], Any]) -> List[Any]:
+        """Ejecutar una búsqueda, pidiendo en paralelo las páginas que falten"""
+        results, total = await self._search_page(jql, 0, min(max_results, SEARCH_PAGE_SIZE), build)
+        
+        # Jira puede devolver menos issues por página de los pedidos
+        page_size = len(results)
+        end = min(max_results, total)
+        if not page_size or page_size >= end:
+            return results
+        
+        # Limitar las páginas en vuelo para no disparar el rate limit de Jira
+        semaphore = asyncio.Semaphore(SEARCH_CONCURRENCY)
+        
+        async def fetch_page(start_at: int) -> Tuple[List[Any], int]:
+            async with semaphore:
+                return await self._search_page(jql, start_at, min(page_size, end - start_at), build)
+        
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(fetch_page(start_at)) for start_at in range(page_size, end, page_size)]
+        except ExceptionGroup as eg:
+            # Propagar el primer error tal cual para que call_tool lo muestre
+            raise eg.exceptions[0] from None
+        
+        for task in tasks:
+            results.extend(task.result()[0])
+        return results
     
     async def search_issues(self, jql: str = None, assignee: str = None, project: str = None, max_results: int = 50) -> List[JiraIssue]:
         """Buscar issues con JQL o filtros"""
+        jql = self._build_jql(jql, assignee, project)
+        issues = await self._search(jql, max_results, _issue_from_json)
         
-        # Construir JQL si no se proporciona
-        if not jql:
-            conditions = []
-            if assignee:
-                if assignee.lower() == "me":
-                    conditions.append("assignee = currentUser()")
-                else:
-                    conditions.append(f"assignee = '{assignee}'")
-            if project:
-                conditions.append(f"project = '{project}'")
-            
-            jql = " AND ".join(conditions) if conditions else "order by updated DESC"
+        for issue in issues:
+            _cache_issue(issue)
         
-        params = {
-            "jql": jql,
-            "maxResults": max_results,
-            "fields": "summary,status,assignee,priority,issuetype,created,updated,description"
-        }
+        return issues
+    
+    async def search_issues_dicts(self, columns: Dict[str, str], jql: str = None, assignee: str = None, project: str = None, max_results: int = 50) -> List[Dict[str, Any]]:
+        """Buscar issues como dicts; columns mapea {clave de salida: campo de JiraIssue}"""
+        jql = self._build_jql(jql, assignee, project)
+        names = tuple(columns)
+        indexes = [JiraIssue._fields.index(field) for field in columns.values()]
+        project_row = operator.itemgetter(*indexes) if len(indexes) > 1 else lambda row: (row[indexes[0]],)
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.jira_url}/rest/api/3/search",
-                headers=self.headers,
-                params=params
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            issues = []
-            for issue in data.get("issues", []):
-                fields = issue["fields"]
-                issues.append(JiraIssue(
-                    key=issue["key"],
-                    summary=fields.get("summary", "Sin título"),
-                    status=fields.get("status", {}).get("name", "Desconocido"),
-                    assignee=fields.get("assignee", {}).get("displayName", "Sin asignar") if fields.get("assignee") else "Sin asignar",
-                    priority=fields.get("priority", {}).get("name", "Sin prioridad") if fields.get("priority") else "Sin prioridad",
-                    issue_type=fields.get("issuetype", {}).get("name", "Desconocido"),
-                    created=fields.get("created", ""),
-                    updated=fields.get("updated", ""),
-                    description=fields.get("description", {}).get("content", [{}])[0].get("content", [{}])[0].get("text", "") if fields.get("description") else ""
-                ))
-            
-            return issues
+        def build(issue: Any) -> Dict[str, Any]:
+            return dict(zip(names, project_row(_issue_from_json(issue))))
+        
+        return await self._search(jql, max_results, build)
     
     async def get_issue(self, issue_key: str) -> Optional[JiraIssue]:
         """Obtener un issue específico"""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.jira_url}/rest/api/3/issue/{issue_key}",
-                headers=self.headers,
-                params={"fields": "summary,status,assignee,priority,issuetype,created,updated,description"}
-            )
-            response.raise_for_status()
-            issue = response.json()
-            fields = issue["fields"]
-            
-            return JiraIssue(
-                key=issue["key"],
-                summary=fields.get("summary", "Sin título"),
-                status=fields.get("status", {}).get("name", "Desconocido"),
-                assignee=fields.get("assignee", {}).get("displayName", "Sin asignar") if fields.get("assignee") else "Sin asignar",
-                priority=fields.get("priority", {}).get("name", "Sin prioridad") if fields.get("priority") else "Sin prioridad",
-                issue_type=fields.get("issuetype", {}).get("name", "Desconocido"),
-                created=fields.get("created", ""),
-                updated=fields.get("updated", ""),
-                description=fields.get("description", {}).get("content", [{}])[0].get("content", [{}])[0].get("text", "") if fields.get("description") else ""
-            )
+        cached = _cached_issue(issue_key)
+        if cached:
+            return cached
+        
+        issue = await self._get_conditional(
+            f"issue:{issue_key.upper()}",
+            f"/rest/api/3/issue/{issue_key}",
+            _issue_from_json,
+            params=self._fields_params
+        )
+        _cache_issue(issue)
+        return issue
     
     async def create_issue(self, project_key: str, summary: str, description: str, issue_type: str = "Task") -> Dict[str, Any]:
         """Crear un nuevo issue"""
@@ -190,48 +411,84 @@ class JiraManager:
             }
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.jira_url}/rest/api/3/issue",
-                headers=self.headers,
-                json=issue_data
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self.client.post("/rest/api/3/issue", json=issue_data)
+        response.raise_for_status()
+        return _loads(response.content)
+    
+    async def _get_transitions(self, issue_key: str) -> Dict[str, str]:
+        """Obtener las transiciones disponibles como {nombre en minúsculas: id}"""
+        response = await self.client.get(f"/rest/api/3/issue/{issue_key}/transitions")
+        response.raise_for_status()
+        transitions = _loads(response.content).get("transitions", [])
+        return {transition["name"].lower(): transition["id"] for transition in transitions}
+    
+    async def _post_transition(self, issue_key: str, transition_id: str) -> httpx.Response:
+        """Ejecutar una transición por id"""
+        transition_data = {
+            "transition": {"id": transition_id}
+        }
+        
+        return await self.client.post(
+            f"/rest/api/3/issue/{issue_key}/transitions",
+            json=transition_data
+        )
+    
+    async def _get_issue_type(self, issue_key: str) -> str:
+        """Obtener solo el tipo de un issue"""
+        response = await self.client.get(f"/rest/api/3/issue/{issue_key}", params=[("fields", "issuetype")])
+        response.raise_for_status()
+        return _name_of(_loads(response.content).get("fields", {}).get("issuetype"), "name", "Desconocido")
     
     async def transition_issue(self, issue_key: str, transition_name: str) -> bool:
         """Cambiar estado de un issue"""
-        # Primero obtener las transiciones disponibles
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.jira_url}/rest/api/3/issue/{issue_key}/transitions",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            transitions = response.json().get("transitions", [])
-            
-            # Buscar la transición por nombre
-            transition_id = None
-            for transition in transitions:
-                if transition["name"].lower() == transition_name.lower():
-                    transition_id = transition["id"]
-                    break
-            
-            if not transition_id:
-                return False
-            
-            # Ejecutar la transición
-            transition_data = {
-                "transition": {"id": transition_id}
-            }
-            
-            response = await client.post(
-                f"{self.jira_url}/rest/api/3/issue/{issue_key}/transitions",
-                headers=self.headers,
-                json=transition_data
-            )
-            response.raise_for_status()
-            return True
+        # El workflow (y por tanto los ids de transición) lo fija el par
+        # (proyecto, tipo de issue)
+        project_key = issue_key.split('-')[0].upper()
+        issue_type = _issue_types.get(issue_key.upper())
+        wanted = transition_name.lower()
+        
+        # Intentar primero con las transiciones cacheadas para el workflow
+        cached = _transition_cache.get((project_key, issue_type)) if issue_type else None
+        known = cached[1] if cached and time.monotonic() - cached[0] < TRANSITION_CACHE_TTL else {}
+        transition_id = known.get(wanted)
+        if transition_id:
+            response = await self._post_transition(issue_key, transition_id)
+            if response.status_code not in (400, 404):
+                response.raise_for_status()
+                _evict_issue(issue_key)
+                return True
+            # La transición no aplica desde el estado actual
+            known = {name: id_ for name, id_ in known.items() if name != wanted}
+        
+        # Obtener las transiciones disponibles (y el tipo si no se conoce)
+        if issue_type:
+            transitions = await self._get_transitions(issue_key)
+        else:
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    transitions_task = tg.create_task(self._get_transitions(issue_key))
+                    type_task = tg.create_task(self._get_issue_type(issue_key))
+            except ExceptionGroup as eg:
+                raise eg.exceptions[0] from None
+            transitions = transitions_task.result()
+            issue_type = type_task.result()
+            _remember_issue_type(issue_key, issue_type)
+            
+            cached = _transition_cache.get((project_key, issue_type))
+            known = cached[1] if cached and time.monotonic() - cached[0] < TRANSITION_CACHE_TTL else {}
+        
+        # Cada estado expone solo algunas transiciones del workflow; los ids son
+        # únicos dentro del workflow, así que se acumulan en la misma entrada
+        _transition_cache[(project_key, issue_type)] = (time.monotonic(), {**known, **transitions})
+        
+        transition_id = transitions.get(wanted)
+        if not transition_id:
+            return False
+        
+        response = await self._post_transition(issue_key, transition_id)
+        response.raise_for_status()
+        _evict_issue(issue_key)
+        return True
     
     async def assign_issue(self, issue_key: str, assignee: str) -> bool:
         """Asignar issue a un usuario"""
@@ -239,14 +496,13 @@ class JiraManager:
             "accountId": assignee if assignee != "me" else None
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.put(
-                f"{self.jira_url}/rest/api/3/issue/{issue_key}/assignee",
-                headers=self.headers,
-                json=assign_data
-            )
-            response.raise_for_status()
-            return True
+        response = await self.client.put(
+            f"/rest/api/3/issue/{issue_key}/assignee",
+            json=assign_data
+        )
+        response.raise_for_status()
+        _evict_issue(issue_key)
+        return True
 
 # Configuración desde variables de entorno
 JIRA_URL = os.getenv("JIRA_URL")
@@ -291,52 +547,30 @@ async def read_resource(uri: str) -> str:
     """Leer contenido de recursos de Jira"""
     try:
         if uri == "jira://my-issues":
-            issues = await jira_manager.search_issues(assignee="me", max_results=20)
-            issues_data = [
-                {
-                    "key": issue.key,
-                    "summary": issue.summary,
-                    "status": issue.status,
-                    "priority": issue.priority,
-                    "type": issue.issue_type,
-                    "updated": issue.updated
-                }
-                for issue in issues
-            ]
-            return json.dumps(issues_data, indent=2, ensure_ascii=False)
+            issues_data = await jira_manager.search_issues_dicts(
+                {"key": "key", "summary": "summary", "status": "status", "priority": "priority", "type": "issue_type", "updated": "updated"},
+                assignee="me",
+                max_results=20
+            )
+            return _dumps(issues_data)
         
         elif uri == "jira://projects":
-            projects = await jira_manager.get_projects()
-            projects_data = [
-                {
-                    "key": project.key,
-                    "name": project.name,
-                    "type": project.project_type,
-                    "lead": project.lead
-                }
-                for project in projects
-            ]
-            return json.dumps(projects_data, indent=2, ensure_ascii=False)
+            projects_data = await jira_manager.get_projects_dicts()
+            return _dumps(projects_data)
         
         elif uri == "jira://recent-issues":
-            issues = await jira_manager.search_issues(jql="order by updated DESC", max_results=20)
-            issues_data = [
-                {
-                    "key": issue.key,
-                    "summary": issue.summary,
-                    "status": issue.status,
-                    "assignee": issue.assignee,
-                    "updated": issue.updated
-                }
-                for issue in issues
-            ]
-            return json.dumps(issues_data, indent=2, ensure_ascii=False)
+            issues_data = await jira_manager.search_issues_dicts(
+                {"key": "key", "summary": "summary", "status": "status", "assignee": "assignee", "updated": "updated"},
+                jql="order by updated DESC",
+                max_results=20
+            )
+            return _dumps(issues_data)
         
         else:
             raise ValueError(f"Recurso no encontrado: {uri}")
     
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dumps({"error": str(e)})
 
 @server.list_tools()
 async def list_tools() -> List[types.Tool]:
@@ -422,16 +656,19 @@ async def call_tool(name: str, arguments: dict) -> List[types.TextContent]:
                     text="🔍 No se encontraron issues con esos criterios"
                 )]
             
-            result = f"🎫 **Issues encontrados:** ({len(issues)} resultados)\n\n"
+            parts = [f"🎫 **Issues encontrados:** ({len(issues)} resultados)\n\n"]
+            append = parts.append
             
             for issue in issues:
-                result += f"🏷️ **{issue.key}** - {issue.summary}\n"
-                result += f"   📊 Estado: {issue.status}\n"
-                result += f"   👤 Asignado: {issue.assignee}\n"
-                result += f"   🔥 Prioridad: {issue.priority}\n"
-                result += f"   📅 Actualizado: {issue.updated[:10]}\n\n"
+                append(
+                    f"🏷️ **{issue.key}** - {issue.summary}\n"
+                    f"   📊 Estado: {issue.status}\n"
+                    f"   👤 Asignado: {issue.assignee}\n"
+                    f"   🔥 Prioridad: {issue.priority}\n"
+                    f"   📅 Actualizado: {issue.updated[:10]}\n\n"
+                )
             
-            return [types.TextContent(type="text", text=result)]
+            return [types.TextContent(type="text", text="".join(parts))]
         
         elif name == "get_issue":
             issue_key = arguments.get("issue_key")
@@ -448,20 +685,22 @@ async def call_tool(name: str, arguments: dict) -> List[types.TextContent]:
                     text=f"❌ No se encontró el issue: {issue_key}"
                 )]
             
-            result = f"🎫 **{issue.key}** - {issue.summary}\n\n"
-            result += f"📊 **Estado:** {issue.status}\n"
-            result += f"👤 **Asignado:** {issue.assignee}\n"
-            result += f"🔥 **Prioridad:** {issue.priority}\n"
-            result += f"🏷️ **Tipo:** {issue.issue_type}\n"
-            result += f"📅 **Creado:** {issue.created[:10]}\n"
-            result += f"🔄 **Actualizado:** {issue.updated[:10]}\n\n"
+            parts = [
+                f"🎫 **{issue.key}** - {issue.summary}\n\n"
+                f"📊 **Estado:** {issue.status}\n"
+                f"👤 **Asignado:** {issue.assignee}\n"
+                f"🔥 **Prioridad:** {issue.priority}\n"
+                f"🏷️ **Tipo:** {issue.issue_type}\n"
+                f"📅 **Creado:** {issue.created[:10]}\n"
+                f"🔄 **Actualizado:** {issue.updated[:10]}\n\n"
+            ]
             
             if issue.description:
-                result += f"📝 **Descripción:**\n{issue.description}\n\n"
+                parts.append(f"📝 **Descripción:**\n{issue.description}\n\n")
             
-            result += f"🔗 **Ver en Jira:** {JIRA_URL}/browse/{issue.key}"
+            parts.append(f"🔗 **Ver en Jira:** {JIRA_URL}/browse/{issue.key}")
             
-            return [types.TextContent(type="text", text=result)]
+            return [types.TextContent(type="text", text="".join(parts))]
         
         elif name == "create_issue":
             project_key = arguments.get("project_key")
@@ -508,12 +747,8 @@ async def call_tool(name: str, arguments: dict) -> List[types.TextContent]:
         
         elif name == "get_my_issues":
             status_filter = arguments.get("status")
-            jql = "assignee = currentUser()"
-            
-            if status_filter:
-                jql += f" AND status = '{status_filter}'"
-            
-            jql += " ORDER BY updated DESC"
+            status_clause = f" AND status = '{_jql_escape(status_filter)}'" if status_filter else ""
+            jql = f"assignee = currentUser(){status_clause} ORDER BY updated DESC"
             
             issues = await jira_manager.search_issues(jql=jql, max_results=30)
             
@@ -523,13 +758,16 @@ async def call_tool(name: str, arguments: dict) -> List[types.TextContent]:
                     text="📋 No tienes issues asignados"
                 )]
             
-            result = f"📋 **Mis Issues:** ({len(issues)} total)\n\n"
+            parts = [f"📋 **Mis Issues:** ({len(issues)} total)\n\n"]
+            append = parts.append
             
             for issue in issues:
-                result += f"🎫 **{issue.key}** - {issue.summary}\n"
-                result += f"   📊 {issue.status} | 🔥 {issue.priority}\n\n"
+                append(
+                    f"🎫 **{issue.key}** - {issue.summary}\n"
+                    f"   📊 {issue.status} | 🔥 {issue.priority}\n\n"
+                )
             
-            return [types.TextContent(type="text", text=result)]
+            return [types.TextContent(type="text", text="".join(parts))]
         
         else:
             return [types.TextContent(
@@ -566,6 +804,8 @@ async def main():
     except Exception as e:
         print(f"❌ Error del servidor: {e}", file=sys.stderr)
         return 1
+    finally:
+        await jira_manager.aclose()
     
     return 0
 
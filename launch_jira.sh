@@ -49,4 +49,4 @@ echo "👤 Email: $JIRA_EMAIL" >&2
 echo "🚀 Ejecutando servidor..." >&2
 
 # Ejecutar el servidor
-exec "$UV_PATH" run python jira_mcp.py
+exec "$UV_PATH" run --extra speedups python jira_mcp.py
@@ -0,0 +1,6 @@
+import os
+
+# jira_mcp valida la configuración al importarse
+os.environ.setdefault("JIRA_URL", "https://jira.example.com")
+os.environ.setdefault("JIRA_EMAIL", "tester@example.com")
+os.environ.setdefault("JIRA_API_TOKEN", "token")
@@ -0,0 +1,406 @@
+import asyncio
+
+import httpx
+import pytest
+
+import jira_mcp
+
+
+def make_manager(handler):
+    """JiraManager cuyo cliente responde con handler en lugar de la red"""
+    manager = jira_mcp.JiraManager("https://jira.example.com", "tester@example.com", "token")
+    manager.client = httpx.AsyncClient(
+        base_url=manager.jira_url,
+        headers=manager.headers,
+        transport=httpx.MockTransport(handler)
+    )
+    return manager
+
+
+def issue_json(key, summary="Resumen", issue_type="Task"):
+    return {
+        "key": key,
+        "fields": {
+            "summary": summary,
+            "status": {"name": "To Do"},
+            "assignee": None,
+            "priority": {"name": "High"},
+            "issuetype": {"name": issue_type},
+            "created": "2025-01-01T00:00:00.000+0000",
+            "updated": "2025-01-02T00:00:00.000+0000",
+            "description": None
+        }
+    }
+
+
+@pytest.fixture(autouse=True, params=["simdjson", "json"])
+def parser(request, monkeypatch):
+    """Ejecutar cada test con simdjson y con el parser de respaldo"""
+    if request.param == "simdjson":
+        pytest.importorskip("simdjson")
+    else:
+        monkeypatch.setattr(jira_mcp, "simdjson", None)
+    return request.param
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    jira_mcp._issue_cache.clear()
+    jira_mcp._transition_cache.clear()
+    jira_mcp._issue_types.clear()
+    yield
+
+
+def test_search_sends_fields_param():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"total": 1, "issues": [issue_json("PROJ-1")]})
+
+    manager = make_manager(handler)
+    issues = asyncio.run(manager.search_issues(jql="project = PROJ", max_results=5))
+
+    assert [issue.key for issue in issues] == ["PROJ-1"]
+    params = requests[0].url.params
+    assert params["fields"] == jira_mcp.ISSUE_FIELDS
+    assert params["jql"] == "project = PROJ"
+    assert params["maxResults"] == "5"
+
+
+def test_get_issue_sends_fields_param():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=issue_json("PROJ-1"))
+
+    manager = make_manager(handler)
+    asyncio.run(manager.get_issue("PROJ-1"))
+
+    assert requests[0].url.path == "/rest/api/3/issue/PROJ-1"
+    assert requests[0].url.params["fields"] == jira_mcp.ISSUE_FIELDS
+
+
+def paged_handler(issues, requests=None):
+    """Responder /search paginando la lista issues según startAt/maxResults"""
+    def handler(request):
+        if requests is not None:
+            requests.append(request)
+        if request.url.path.startswith("/rest/api/3/issue/"):
+            return httpx.Response(200, json=issue_json(request.url.path.rsplit("/", 1)[1]))
+        start_at = int(request.url.params["startAt"])
+        max_results = int(request.url.params["maxResults"])
+        page = issues[start_at:start_at + max_results]
+        return httpx.Response(200, json={"startAt": start_at, "total": len(issues), "issues": page})
+    return handler
+
+
+def test_search_fetches_remaining_pages():
+    issues = [issue_json(f"PROJ-{n}") for n in range(150)]
+    requests = []
+    manager = make_manager(paged_handler(issues, requests))
+
+    result = asyncio.run(manager.search_issues(jql="project = PROJ", max_results=150))
+
+    assert [issue.key for issue in result] == [issue["key"] for issue in issues]
+    assert sorted(int(r.url.params["startAt"]) for r in requests) == [0, 100]
+
+
+def test_search_stops_at_total():
+    requests = []
+    manager = make_manager(paged_handler([issue_json(f"PROJ-{n}") for n in range(5)], requests))
+
+    result = asyncio.run(manager.search_issues(jql="project = PROJ", max_results=1000))
+
+    assert len(result) == 5
+    assert len(requests) == 1
+
+
+def test_failed_page_does_not_break_later_parsing():
+    issues = [issue_json(f"PROJ-{n}") for n in range(150)]
+    del issues[120]["fields"]
+    manager = make_manager(paged_handler(issues))
+
+    with pytest.raises(Exception):
+        asyncio.run(manager.search_issues(jql="project = PROJ", max_results=150))
+
+    issue = asyncio.run(manager.get_issue("PROJ-7"))
+    assert issue.key == "PROJ-7"
+
+
+def test_issue_cache_ignores_key_case():
+    requests = []
+    manager = make_manager(paged_handler([], requests))
+
+    asyncio.run(manager.get_issue("PROJ-1"))
+    asyncio.run(manager.get_issue("proj-1"))
+    assert len(requests) == 1
+
+    jira_mcp._evict_issue("proj-1")
+    asyncio.run(manager.get_issue("PROJ-1"))
+    assert len(requests) == 2
+
+
+def transitions_handler(workflows, issue_types, posted):
+    """Responder issues y transiciones según el workflow de cada tipo de issue"""
+    def handler(request):
+        parts = request.url.path.split("/")
+        key = parts[5].upper()
+        transitions = workflows[issue_types[key]]
+        if parts[-1] == "transitions":
+            if request.method == "POST":
+                transition_id = jira_mcp._loads(request.content)["transition"]["id"]
+                posted.append((key, transition_id))
+                valid = any(t["id"] == transition_id for t in transitions)
+                return httpx.Response(204 if valid else 400)
+            return httpx.Response(200, json={"transitions": transitions})
+        return httpx.Response(200, json=issue_json(key, issue_type=issue_types[key]))
+    return handler
+
+
+def test_transition_cache_is_per_issue_type():
+    workflows = {
+        "Bug": [{"id": "31", "name": "Done"}],
+        "Task": [{"id": "31", "name": "In Review"}, {"id": "41", "name": "Done"}],
+    }
+    issue_types = {"PROJ-1": "Bug", "PROJ-2": "Task", "PROJ-3": "Bug"}
+    posted = []
+    manager = make_manager(transitions_handler(workflows, issue_types, posted))
+
+    async def run():
+        for key in ("PROJ-1", "PROJ-2", "PROJ-3"):
+            await manager.get_issue(key)
+            assert await manager.transition_issue(key, "done")
+
+    asyncio.run(run())
+
+    assert posted == [("PROJ-1", "31"), ("PROJ-2", "41"), ("PROJ-3", "31")]
+    assert set(jira_mcp._transition_cache) == {("PROJ", "Bug"), ("PROJ", "Task")}
+
+
+def test_repeated_transitions_skip_transitions_get():
+    workflows = {"Task": [{"id": "21", "name": "In Progress"}, {"id": "31", "name": "Done"}]}
+    issue_types = {"PROJ-1": "Task", "PROJ-2": "Task"}
+    posted = []
+    handler = transitions_handler(workflows, issue_types, posted)
+    requests = []
+
+    def recording(request):
+        requests.append((request.method, request.url.path))
+        return handler(request)
+
+    manager = make_manager(recording)
+
+    async def run():
+        await manager.get_issue("PROJ-1")
+        assert await manager.transition_issue("PROJ-1", "In Progress")
+        assert await manager.transition_issue("PROJ-1", "Done")
+        # Sin get_issue previo: el tipo se pide junto a las transiciones una vez
+        assert await manager.transition_issue("proj-2", "Done")
+        assert await manager.transition_issue("PROJ-2", "In Progress")
+
+    asyncio.run(run())
+
+    transition_gets = [path for method, path in requests if method == "GET" and path.endswith("/transitions")]
+    assert transition_gets == ["/rest/api/3/issue/PROJ-1/transitions", "/rest/api/3/issue/proj-2/transitions"]
+    assert posted == [("PROJ-1", "21"), ("PROJ-1", "31"), ("PROJ-2", "31"), ("PROJ-2", "21")]
+
+
+def test_rejected_cached_transition_is_refetched():
+    workflows = {"Task": [{"id": "21", "name": "In Progress"}, {"id": "31", "name": "Done"}]}
+    issue_types = {"PROJ-1": "Task"}
+    posted = []
+    manager = make_manager(transitions_handler(workflows, issue_types, posted))
+
+    async def run():
+        await manager.get_issue("PROJ-1")
+        assert await manager.transition_issue("PROJ-1", "Done")
+        # El workflow cambia: "Done" pasa a tener otro id
+        workflows["Task"] = [{"id": "41", "name": "Done"}]
+        assert await manager.transition_issue("PROJ-1", "Done")
+
+    asyncio.run(run())
+
+    assert posted == [("PROJ-1", "31"), ("PROJ-1", "31"), ("PROJ-1", "41")]
+    assert jira_mcp._transition_cache[("PROJ", "Task")][1] == {"in progress": "21", "done": "41"}
+
+
+def test_search_dicts_match_issue_fields():
+    raw = issue_json("PROJ-1")
+    raw["fields"]["assignee"] = {"displayName": "Ana"}
+    raw["fields"]["status"] = None
+    manager = make_manager(paged_handler([raw]))
+    columns = {name: name for name in jira_mcp.JiraIssue._fields}
+
+    async def run():
+        return await manager.search_issues(jql="x"), await manager.search_issues_dicts(columns, jql="x")
+
+    issues, dicts = asyncio.run(run())
+
+    assert dicts == [issues[0]._asdict()]
+    assert issues[0].assignee == "Ana"
+    assert issues[0].status == "Desconocido"
+
+
+def test_projects_share_one_etag_entry():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        projects = [{"key": "PROJ", "name": "Proyecto", "projectTypeKey": "software", "lead": None}]
+        return httpx.Response(200, json=projects, headers={"ETag": '"v1"'})
+
+    manager = make_manager(handler)
+
+    async def run():
+        return await manager.get_projects_dicts(), await manager.get_projects()
+
+    dicts, projects = asyncio.run(run())
+
+    assert dicts == [{"key": "PROJ", "name": "Proyecto", "type": "software", "lead": "Sin asignar"}]
+    assert projects == [jira_mcp.JiraProject("PROJ", "Proyecto", "software", "Sin asignar")]
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+    assert list(manager._etag_cache) == ["projects"]
+
+
+@pytest.mark.parametrize("desc, expected", [
+    ({"content": [{"content": [{"text": "hola"}]}]}, "hola"),
+    (None, ""),
+    ({}, ""),
+    ({"content": []}, ""),
+    ({"content": [{"content": [{"type": "hardBreak"}]}]}, ""),
+])
+def test_desc_text(desc, expected):
+    assert jira_mcp._desc_text(desc) == expected
+
+
+def test_missing_fields_names_the_field(parser):
+    raw = issue_json("PROJ-1")
+    del raw["fields"]
+    manager = make_manager(paged_handler([raw]))
+
+    with pytest.raises(ValueError, match=r"'fields' \(PROJ-1\)"):
+        asyncio.run(manager.search_issues(jql="x"))
+
+
+def test_missing_field_on_later_page_reaches_call_tool(monkeypatch):
+    issues = [issue_json(f"PROJ-{n}") for n in range(150)]
+    del issues[120]["fields"]
+    monkeypatch.setattr(jira_mcp, "jira_manager", make_manager(paged_handler(issues)))
+
+    result = asyncio.run(jira_mcp.call_tool("search_issues", {"jql": "x", "max_results": 150}))
+
+    assert result[0].text == "❌ Error: Respuesta de Jira sin el campo 'fields' (PROJ-120)"
+
+
+def test_search_dicts_rename_and_single_column():
+    manager = make_manager(paged_handler([issue_json("PROJ-1", issue_type="Bug")]))
+
+    async def run():
+        return (
+            await manager.search_issues_dicts({"key": "key", "type": "issue_type"}, jql="x"),
+            await manager.search_issues_dicts({"type": "issue_type"}, jql="x"),
+        )
+
+    renamed, single = asyncio.run(run())
+
+    assert renamed == [{"key": "PROJ-1", "type": "Bug"}]
+    assert single == [{"type": "Bug"}]
+
+
+def test_search_limits_pages_in_flight():
+    issues = [issue_json(f"PROJ-{n}") for n in range(1000)]
+    serve = paged_handler(issues)
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return serve(request)
+
+    manager = make_manager(handler)
+    result = asyncio.run(manager.search_issues(jql="x", max_results=1000))
+
+    assert len(result) == 1000
+    assert peak == jira_mcp.SEARCH_CONCURRENCY
+
+
+def issue_requests(requests):
+    return [r for r in requests if r.url.path.startswith("/rest/api/3/issue/")]
+
+
+def test_issue_cache_expires_after_ttl():
+    requests = []
+    manager = make_manager(paged_handler([], requests))
+
+    asyncio.run(manager.get_issue("PROJ-1"))
+    asyncio.run(manager.get_issue("PROJ-1"))
+    assert len(requests) == 1
+
+    # Envejecer la entrada más allá del TTL
+    stored_at, issue = jira_mcp._issue_cache["PROJ-1"]
+    jira_mcp._issue_cache["PROJ-1"] = (stored_at - jira_mcp.ISSUE_CACHE_TTL - 1, issue)
+
+    asyncio.run(manager.get_issue("PROJ-1"))
+    assert len(requests) == 2
+
+
+def test_issue_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(jira_mcp, "ISSUE_CACHE_SIZE", 2)
+    requests = []
+    manager = make_manager(paged_handler([], requests))
+
+    async def run():
+        await manager.get_issue("PROJ-1")
+        await manager.get_issue("PROJ-2")
+        await manager.get_issue("PROJ-1")  # PROJ-1 pasa a ser el más reciente
+        await manager.get_issue("PROJ-3")  # descarta PROJ-2
+
+    asyncio.run(run())
+
+    assert list(jira_mcp._issue_cache) == ["PROJ-1", "PROJ-3"]
+    assert len(requests) == 3
+
+
+def test_search_warms_issue_cache():
+    requests = []
+    manager = make_manager(paged_handler([issue_json("PROJ-1", summary="Desde búsqueda")], requests))
+
+    async def run():
+        await manager.search_issues(jql="x")
+        return await manager.get_issue("proj-1")
+
+    issue = asyncio.run(run())
+
+    assert issue.summary == "Desde búsqueda"
+    assert issue_requests(requests) == []
+
+
+def test_get_issue_revalidates_with_etag():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=issue_json("PROJ-1", summary="Original"), headers={"ETag": '"v1"'})
+
+    manager = make_manager(handler)
+
+    first = asyncio.run(manager.get_issue("PROJ-1"))
+    # Saltarse la caché de issues para forzar la revalidación
+    jira_mcp._issue_cache.clear()
+    second = asyncio.run(manager.get_issue("proj-1"))
+
+    assert "If-None-Match" not in requests[0].headers
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+    assert second == first
+    assert second.summary == "Original"
+    assert list(manager._etag_cache) == ["issue:PROJ-1"]